@@ -1,19 +1,27 @@
 import anthropic
 import os
-import base64
+from functools import lru_cache
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+@lru_cache(maxsize=None)
+def get_client(api_key):
+    """Return a shared Claude client per API key (keeps the connection pool alive)"""
+    return anthropic.Anthropic(api_key=api_key)
+
 def summarize_pdf(pdf_path, api_key, page_number=None, custom_prompt=None):
     """Summarize PDF using Claude API with direct PDF processing"""
-    # Initialize Claude
-    client = anthropic.Anthropic(api_key=api_key)
+    # Reuse the cached Claude client for this key
+    client = get_client(api_key)
     
-    # Read PDF as binary and encode to base64
+    # Upload PDF through the Files API (streamed, no base64 copy in memory)
     with open(pdf_path, "rb") as pdf_file:
-        pdf_data = base64.standard_b64encode(pdf_file.read()).decode("utf-8")
+        file_upload = client.beta.files.upload(
+            file=(Path(pdf_path).name, pdf_file, "application/pdf"),
+        )
     
     # Create prompt based on whether a specific page is requested
     if page_number:
@@ -48,32 +56,39 @@ Format your response as:
 
 Keep each summary concise and focus on the main topic or action of that page."""
     
-    # Create prompt with PDF document
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=16000,  # Increased for longer documents
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "document",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "application/pdf",
-                            "data": pdf_data,
+    # Create prompt with PDF document; the upload is single-use, so always delete it
+    try:
+        message = client.beta.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=16000,  # Increased for longer documents
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "document",
+                            "source": {
+                                "type": "file",
+                                "file_id": file_upload.id,
+                            },
                         },
-                    },
-                    {
-                        "type": "text",
-                        "text": prompt_text
-                    }
-                ],
-            }
-        ],
-    )
+                        {
+                            "type": "text",
+                            "text": prompt_text
+                        }
+                    ],
+                }
+            ],
+            betas=["files-api-2025-04-14"],
+        )
     
-    return message.content[0].text
+        return message.content[0].text
+    finally:
+        # Best-effort cleanup: never let a failed delete hide the result or the original error
+        try:
+            client.beta.files.delete(file_upload.id)
+        except anthropic.APIError:
+            print(f"Warning: could not delete uploaded file {file_upload.id}")
 
 # Run it
 if __name__ == "__main__":